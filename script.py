@@ -1,38 +1,93 @@
 import os
 import re
 import json
+import hashlib
+import functools
+import tempfile
 import requests
-from bs4 import BeautifulSoup, Tag, NavigableString
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer, Tag, NavigableString
 import argparse
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Set, Union
 from urllib.parse import urlparse
 
+# Prefer the C-backed lxml parser when it is installed
+try:
+    import lxml  # noqa: F401
+    _PARSER = "lxml"
+except ImportError:
+    _PARSER = "html.parser"
 
-def extract_project_details(project_html: str) -> Dict[str, Any]:
+# Prefer the native orjson encoder when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Fields we want to extract from each project
+FIELDS = [
+    "Project Title", "Department", "Faculty Mentor", "Ph.D. Student Mentor(s)",
+    "Terms Available", "Student Level", "Prerequisites", "Credit", "Stipend", 
+    "Application Requirements", "Application Deadline", "Website", "Project Description"
+]
+
+# Output key for each field, e.g. "Faculty Mentor" -> "faculty_mentor"
+FIELD_KEYS = {field: field.lower().replace(" ", "_") for field in FIELDS}
+
+# Literal label strings for each field, matched when followed by a colon;
+# labels may carry a plural suffix on some pages, e.g. "Website(s):"
+FIELD_LABELS = [(field, field) for field in FIELDS] + [
+    (f"{field}(s)", field) for field in FIELDS if not field.endswith("(s)")
+]
+
+# Precompiled regex patterns, built once at import rather than per project
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+')
+MAILTO_RE = re.compile(r'^mailto:', re.I)
+TITLE_PREFIX_RE = re.compile(r'^Project Title(?:\s*#\d+)?:\s*')
+TITLE_LABEL_RE = re.compile(r'Project Title(?:\s*#\d+)?')
+PROJECT_SPLIT_RE = re.compile(r'<p>\s*<strong>Project Title(?:\s*#\d+)?:')
+
+# Projects live in the page's entry-content div; the rest of the page is skipped when parsing
+ENTRY_CONTENT_STRAINER = SoupStrainer('div', class_='entry-content')
+
+# Shared HTTP session so department pages reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8, pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+REQUEST_TIMEOUT = 30
+MAX_WORKERS = 8
+
+# Downloaded pages are cached on disk, keyed by the SHA-256 of their URL
+CACHE_DIR = "./.cache"
+
+# Output directories already created by save_to_json in this process
+_ENSURED_DIRS: Set[str] = set()
+
+
+def extract_project_details(project_html: Union[Tag, str]) -> Dict[str, Any]:
     """
-    Extract project details from an HTML string representing a single project.
+    Extract project details from the HTML representing a single project.
     
     Args:
-        project_html: HTML string containing project information
+        project_html: Parsed Tag or HTML string containing project information
         
     Returns:
         Dictionary with project details
     """
-    soup = BeautifulSoup(project_html, 'html.parser')
+    # Tags from split_projects are used as-is to avoid parsing the section twice
+    if isinstance(project_html, Tag):
+        soup = project_html
+    else:
+        soup = BeautifulSoup(project_html, _PARSER)
     project_data = {}
     
-    # Extract all text from the project HTML
-    text = soup.get_text(strip=True)
-    
-    # Define the fields we want to extract
-    fields = [
-        "Project Title", "Department", "Faculty Mentor", "Ph.D. Student Mentor(s)",
-        "Terms Available", "Student Level", "Prerequisites", "Credit", "Stipend", 
-        "Application Requirements", "Application Deadline", "Website", "Project Description"
-    ]
-    
     # First, try to find the project title specifically
-    title_strong = soup.find('strong', string=lambda s: s and ('Project Title' in s))
+    title_strong = soup.find('strong', string=TITLE_LABEL_RE)
     if title_strong:
         # Get the full title text including any numbers
         title_text = title_strong.get_text().strip()
@@ -50,79 +105,111 @@ def extract_project_details(project_html: str) -> Dict[str, Any]:
         title_key = "project_title"
         if title_value:
             # Remove "Project Title:" or "Project Title #X:" from the beginning
-            project_data[title_key] = re.sub(r'^Project Title(?:\s*#\d+)?:\s*', '', title_value).strip()
+            project_data[title_key] = TITLE_PREFIX_RE.sub('', title_value, count=1).strip()
     
-    # Extract each field from the HTML using regex
-    for field in fields:
-        # Skip project title as we handled it separately
-        if field == "Project Title":
-            continue
+    # Extract fields directly from the HTML structure first
+    paragraphs = [soup] if soup.name == 'p' else soup.find_all('p')
+    remaining = set(FIELDS)
+    for p in paragraphs:
+        # Stop walking paragraphs once every field has been found
+        if not remaining:
+            break
+        
+        # Walk the paragraph's children once, grouping the content that
+        # follows each <strong> label until the next label
+        labelled_values = []
+        for child in p.children:
+            if isinstance(child, Tag) and child.name == 'strong':
+                labelled_values.append((child.get_text(), []))
+            elif labelled_values:
+                labelled_values[-1][1].append(child.get_text() if isinstance(child, Tag) else str(child))
+        
+        for label, parts in labelled_values:
+            key = label.replace(':', '').strip()
+            
+            # Handle numbered project titles 
+            if "Project Title" in key:
+                key = "Project Title"
             
-        pattern = re.compile(f"{field}:(.*?)(?=(?:{'|'.join(fields)}:)|$)", re.DOTALL)
-        matches = re.findall(pattern, text)
+            if key in FIELD_KEYS:
+                field_key = FIELD_KEYS[key]
+                value = ''.join(parts)
+                
+                # For project_title, clean up any numbering format
+                if field_key == "project_title":
+                    # Remove "Project Title:" or "Project Title #X:" from the beginning
+                    value = TITLE_PREFIX_RE.sub('', value, count=1).strip()
+                
+                project_data[field_key] = value.strip()
+                remaining.discard(key)
+    
+    # Fall back to the flattened text for any fields the HTML structure did
+    # not provide, skipping this pass entirely when nothing is missing
+    if remaining:
+        # Extract all text from the project HTML
+        text = soup.get_text(strip=True)
         
-        # If we found a match, clean it up and add it to our data
-        if matches:
-            # Make sure we're dealing with a string, not a tuple
-            match_value = matches[0]
-            if isinstance(match_value, tuple):
-                match_value = ' '.join(filter(None, match_value))
-            project_data[field.lower().replace(" ", "_")] = match_value.strip()
-    
-    # Attempt direct extraction using HTML structure
-    paragraphs = soup.find_all('p')
-    for p in paragraphs:
-        text_content = p.get_text()
-        for field in fields:
-            if field in text_content:
-                # Extract key-value pairs based on <strong> tags
-                strong_tags = p.find_all('strong')
-                for strong in strong_tags:
-                    key = strong.get_text().replace(':', '').strip()
-                    
-                    # Handle numbered project titles 
-                    if "Project Title" in key:
-                        key = "Project Title"
-                    
-                    value = ""
-                    next_element = strong.next_sibling
-                    while next_element and not (hasattr(next_element, 'name') and next_element.name == 'strong'):
-                        if hasattr(next_element, 'get_text'):
-                            value += next_element.get_text()
-                        elif isinstance(next_element, str):
-                            value += next_element
-                        if hasattr(next_element, 'next_sibling'):
-                            next_element = next_element.next_sibling
-                        else:
-                            break
-                    
-                    if key in fields:
-                        field_key = key.lower().replace(" ", "_")
-                        
-                        # For project_title, clean up any numbering format
-                        if field_key == "project_title":
-                            # Remove "Project Title:" or "Project Title #X:" from the beginning
-                            value = re.sub(r'^Project Title(?:\s*#\d+)?:\s*', '', value).strip()
-                        
-                        project_data[field_key] = value.strip()
-    
-    # Extract emails using a regex pattern
-    emails = re.findall(r'[\w\.-]+@[\w\.-]+', str(soup))
-    if emails:
-        project_data['contact_email'] = emails[0]
-    
-    # Clean up any remaining HTML tags in text fields
+        # Locate every field label with plain substring search, then slice each
+        # value from the end of its label to the start of the next label
+        positions = []
+        for label, field in FIELD_LABELS:
+            pos = text.find(label)
+            while pos >= 0:
+                # Allow whitespace between a label and its colon, e.g. "Credit :"
+                value_start = pos + len(label)
+                while value_start < len(text) and text[value_start].isspace():
+                    value_start += 1
+                if text.startswith(':', value_start):
+                    positions.append((pos, value_start + 1, field))
+                pos = text.find(label, pos + len(label))
+        positions.sort()
+        
+        for i, (_, value_start, field) in enumerate(positions):
+            # Skip project title as we handled it separately, and keep the
+            # first occurrence of every other missing field
+            if field == "Project Title" or field not in remaining:
+                continue
+            
+            end = positions[i + 1][0] if i + 1 < len(positions) else len(text)
+            project_data[FIELD_KEYS[field]] = text[value_start:end].strip()
+            remaining.discard(field)
+    
+    # Extract emails using a regex pattern. Join text nodes with a space so an
+    # address never runs into the text of the tag that follows it
+    email_match = EMAIL_RE.search(soup.get_text(' '))
+    if not email_match:
+        # Some addresses only appear in mailto: links, not in the visible text
+        mailto_link = soup.find('a', href=MAILTO_RE)
+        if mailto_link:
+            email_match = EMAIL_RE.search(mailto_link['href'])
+    if email_match:
+        project_data['contact_email'] = email_match.group(0)
+    
+    # Clean up multiple spaces and line breaks in text fields. Every value was
+    # taken from parsed text nodes, so there are no HTML tags left to strip
     for key in project_data:
         if isinstance(project_data[key], str):
-            # Remove HTML tags
-            project_data[key] = re.sub(r'<[^>]+>', '', project_data[key])
-            # Clean up multiple spaces and line breaks
-            project_data[key] = re.sub(r'\s+', ' ', project_data[key]).strip()
+            project_data[key] = " ".join(project_data[key].split())
     
     return project_data
 
 
-def split_projects(html_content: str) -> List[str]:
+@functools.lru_cache(maxsize=32)
+def parse_html(html_content: str) -> BeautifulSoup:
+    """
+    Parse the entry-content section of an HTML document, reusing the tree if
+    the same content was parsed before.
+    
+    Args:
+        html_content: Full HTML content to parse
+        
+    Returns:
+        Parsed BeautifulSoup tree (shared between callers, so do not modify it)
+    """
+    return BeautifulSoup(html_content, _PARSER, parse_only=ENTRY_CONTENT_STRAINER)
+
+
+def split_projects(html_content: str) -> List[Union[Tag, str]]:
     """
     Split the HTML content into individual project sections.
     
@@ -130,9 +217,9 @@ def split_projects(html_content: str) -> List[str]:
         html_content: Full HTML content from the file
         
     Returns:
-        List of HTML strings, each containing one project
+        List of parsed Tags (or HTML strings), each containing one project
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = parse_html(html_content)
     entry_content = soup.find('div', class_='entry-content')
     
     if not entry_content:
@@ -145,12 +232,9 @@ def split_projects(html_content: str) -> List[str]:
     
     for p in paragraphs:
         # Check if this paragraph contains a project title (including numbered ones)
-        title_tag = p.find('strong', string=lambda s: s and (
-            'Project Title' in s or 
-            re.search(r'Project Title\s*#\d+', s) is not None)
-        )
+        title_tag = p.find('strong', string=TITLE_LABEL_RE)
         if title_tag:
-            projects.append(str(p))
+            projects.append(p)
     
     # If no projects were found using the above method, try an alternative approach
     if not projects:
@@ -158,7 +242,7 @@ def split_projects(html_content: str) -> List[str]:
         html_str = str(entry_content)
         
         # Look for both "Project Title:" and "Project Title #X:"
-        project_sections = re.split(r'<p>\s*<strong>Project Title(?:\s*#\d+)?:', html_str)
+        project_sections = PROJECT_SPLIT_RE.split(html_str)
         
         if len(project_sections) > 1:
             # Skip the first element if it doesn't contain a project
@@ -171,97 +255,193 @@ def split_projects(html_content: str) -> List[str]:
         # Look for any paragraph with a strong tag - might be a different format
         for p in paragraphs:
             if p.find('strong'):
-                projects.append(str(p))
+                projects.append(p)
                 
     return projects
 
 
-def get_html_content(source: str) -> tuple:
+def get_cache_file(url: str) -> str:
     """
-    Get HTML content either from a local file or a URL.
+    Get the on-disk cache path for a URL.
+    
+    Args:
+        url: URL of the page
+        
+    Returns:
+        Path of the cached HTML file
+    """
+    return os.path.join(CACHE_DIR, f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.html")
+
+
+def fetch_cached(url: str, use_cache: bool = True) -> str:
+    """
+    Fetch the HTML at a URL, using the on-disk cache when possible.
+    
+    Args:
+        url: URL to fetch
+        use_cache: Whether to read from the cache; fresh downloads are always written to it
+        
+    Returns:
+        HTML content of the page
+    """
+    cache_file = get_cache_file(url)
+    
+    if use_cache and os.path.exists(cache_file):
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    # Fetch the content from the URL
+    response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()  # Raise an exception for HTTP errors
+    
+    # Decode explicitly so requests skips its charset detection; the pages
+    # are UTF-8 unless the server declares a charset
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        encoding = response.encoding
+    else:
+        encoding = 'utf-8'
+    html_content = response.content.decode(encoding, errors='replace')
+    
+    # Write to a temporary file and move it into place, so an interrupted
+    # write never leaves a truncated page in the cache
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_file = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        os.replace(tmp_file, cache_file)
+    except BaseException:
+        os.remove(tmp_file)
+        raise
+    
+    return html_content
+
+
+def load_html(source: str, use_cache: bool = True) -> str:
+    """
+    Load HTML content from a local file or a URL without printing anything,
+    so it can run in worker threads.
     
     Args:
         source: Path to local file or URL
+        use_cache: Whether to reuse previously downloaded pages for URLs
         
     Returns:
-        Tuple of (html_content, department_name)
+        HTML content of the source
+    """
+    if source.startswith('http'):
+        return fetch_cached(source, use_cache)
+    
+    with open(source, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def get_department(source: str) -> str:
+    """
+    Get the department name for a local file or URL.
+    
+    Args:
+        source: Path to local file or URL
+        
+    Returns:
+        Department name taken from the URL path or the file name
     """
-    # Check if the source is a URL
     if source.startswith('http'):
         # Get the department name from the URL
         path_parts = urlparse(source).path.strip('/').split('/')
-        department = path_parts[-1].replace('-', '_')
-        
-        print(f"Fetching content from {source}")
-        
-        # Fetch the content from the URL
-        response = requests.get(source)
-        response.raise_for_status()  # Raise an exception for HTTP errors
-        html_content = response.text
-        
-        return html_content, department
-    else:
-        # Read from local file
-        with open(source, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        # Get department from filename
-        department = os.path.basename(source).replace('.html', '')
+        return path_parts[-1].replace('-', '_')
+    
+    # Get department from filename
+    return os.path.basename(source).replace('.html', '')
+
+
+def get_html_content(source: str, use_cache: bool = True) -> tuple:
+    """
+    Get HTML content either from a local file or a URL.
+    
+    Args:
+        source: Path to local file or URL
+        use_cache: Whether to reuse previously downloaded pages for URLs
         
-        return html_content, department
+    Returns:
+        Tuple of (html_content, department_name)
+    """
+    # Check if the source is a URL
+    if source.startswith('http'):
+        if use_cache and os.path.exists(get_cache_file(source)):
+            print(f"Using cached content for {source}")
+        else:
+            print(f"Fetching content from {source}")
+    
+    return load_html(source, use_cache), get_department(source)
 
 
-def scrape_research_projects(source: str) -> List[Dict[str, Any]]:
+def scrape_research_projects(source: str, use_cache: bool = True) -> List[Dict[str, Any]]:
     """
     Scrape research projects from the provided HTML file or URL.
     
     Args:
         source: Path to the HTML file or URL to scrape
+        use_cache: Whether to reuse previously downloaded pages for URLs
         
     Returns:
         List of dictionaries containing project data
     """
     try:
-        html_content, department = get_html_content(source)
-        
-        # Split the HTML into individual project sections
-        project_sections = split_projects(html_content)
-        
-        if not project_sections:
-            print(f"Warning: No project sections found in {source}")
-            return []
-            
-        print(f"Found {len(project_sections)} potential projects in {source}")
-        
-        # Process each project section
-        projects = []
-        for i, section in enumerate(project_sections):
-            try:
-                project_data = extract_project_details(section)
-                # Add the department if not already present
-                if 'department' not in project_data:
-                    project_data['department'] = department
-                
-                # If we couldn't extract a project title, this might not be a valid project
-                if 'project_title' not in project_data or not project_data['project_title']:
-                    print(f"Warning: No project title found in section {i+1}, skipping")
-                    continue
-                
-                # Add source information
-                project_data['source'] = source
-                project_data['project_id'] = f"{department}_{i+1}"
-                
-                projects.append(project_data)
-            except Exception as e:
-                print(f"Error processing project {i+1} in {source}: {str(e)}")
-        
-        return projects
+        html_content, department = get_html_content(source, use_cache)
+        return extract_projects(html_content, department, source)
         
     except Exception as e:
         print(f"Error scraping {source}: {str(e)}")
         return []
 
 
+def extract_projects(html_content: str, department: str, source: str) -> List[Dict[str, Any]]:
+    """
+    Extract research projects from the HTML content of a department page.
+    
+    Args:
+        html_content: Full HTML content of the page
+        department: Department name used for defaults and project IDs
+        source: Path or URL the content came from
+        
+    Returns:
+        List of dictionaries containing project data
+    """
+    # Split the HTML into individual project sections
+    project_sections = split_projects(html_content)
+    
+    if not project_sections:
+        print(f"Warning: No project sections found in {source}")
+        return []
+        
+    print(f"Found {len(project_sections)} potential projects in {source}")
+    
+    # Process each project section
+    projects = []
+    for i, section in enumerate(project_sections):
+        try:
+            project_data = extract_project_details(section)
+            # Add the department if not already present
+            if 'department' not in project_data:
+                project_data['department'] = department
+            
+            # If we couldn't extract a project title, this might not be a valid project
+            if 'project_title' not in project_data or not project_data['project_title']:
+                print(f"Warning: No project title found in section {i+1}, skipping")
+                continue
+            
+            # Add source information
+            project_data['source'] = source
+            project_data['project_id'] = f"{department}_{i+1}"
+            
+            projects.append(project_data)
+        except Exception as e:
+            print(f"Error processing project {i+1} in {source}: {str(e)}")
+    
+    return projects
+
+
 def save_to_json(data: List[Dict[str, Any]], output_file: str) -> None:
     """
     Save the extracted data to a JSON file.
@@ -270,40 +450,57 @@ def save_to_json(data: List[Dict[str, Any]], output_file: str) -> None:
         data: List of project dictionaries
         output_file: Path where the JSON file will be saved
     """
-    # Create the directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    # Create the directory if it doesn't exist, once per process
+    output_dir = os.path.dirname(output_file)
+    if output_dir and output_dir not in _ENSURED_DIRS:
+        os.makedirs(output_dir, exist_ok=True)
+        _ENSURED_DIRS.add(output_dir)
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
     
     print(f"Saved {len(data)} projects to {output_file}")
 
 
-def batch_scrape(urls: List[str], save_individual: bool = True) -> None:
+def batch_scrape(urls: List[str], save_individual: bool = True, use_cache: bool = True) -> None:
     """
     Scrape multiple URLs and save results.
     
     Args:
         urls: List of URLs to scrape
         save_individual: Whether to save individual JSON files for each department
+        use_cache: Whether to reuse previously downloaded pages
     """
     all_projects = []
     
-    for url in urls:
-        print(f"\n--- Processing {url} ---")
-        projects = scrape_research_projects(url)
+    # Download the pages concurrently since that work is mostly network I/O.
+    # Parsing and all output stay on the main thread, in the order of the URLs
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pages = [executor.submit(load_html, url, use_cache) for url in urls]
         
-        # Extract department name from URL for the output file
-        path_parts = urlparse(url).path.strip('/').split('/')
-        department = path_parts[-1].replace('-', '_')
-        
-        # Add to combined results
-        all_projects.extend(projects)
-        
-        # Optionally save individual department results
-        if save_individual:
-            output_file = f"./data/json/{department}_projects.json"
-            save_to_json(projects, output_file)
+        for url, page in zip(urls, pages):
+            print(f"\n--- Processing {url} ---")
+            try:
+                projects = extract_projects(page.result(), get_department(url), url)
+            except Exception as e:
+                print(f"Error scraping {url}: {str(e)}")
+                projects = []
+            
+            # Extract department name from URL for the output file
+            path_parts = urlparse(url).path.strip('/').split('/')
+            department = path_parts[-1].replace('-', '_')
+            
+            # Add to combined results
+            all_projects.extend(projects)
+            
+            # Optionally save individual department results
+            if save_individual:
+                output_file = f"./data/json/{department}_projects.json"
+                save_to_json(projects, output_file)
     
     # Save combined results
     if all_projects:
@@ -323,6 +520,7 @@ def main():
     parser.add_argument("--source", help="Path to the HTML file or URL to scrape (optional)")
     parser.add_argument("--output", "-o", help="Output JSON file path (optional)", default=None)
     parser.add_argument("--batch", "-b", action="store_true", help="Run batch scraping for all departments")
+    parser.add_argument("--no-cache", action="store_true", help="Re-download pages instead of using the local cache")
     
     args = parser.parse_args()
     
@@ -336,7 +534,7 @@ def main():
     # Run batch mode (scrape all departments)
     if args.batch or not args.source:
         print("Running batch scraping for all departments...")
-        batch_scrape(department_urls)
+        batch_scrape(department_urls, use_cache=not args.no_cache)
         return
     
     # Single source mode
@@ -357,7 +555,7 @@ def main():
         args.output = f"./data/json/{department}_projects.json"
     
     # Scrape the projects
-    projects = scrape_research_projects(source)
+    projects = scrape_research_projects(source, use_cache=not args.no_cache)
     
     # Save to JSON
     save_to_json(projects, args.output)